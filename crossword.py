@@ -17,6 +17,10 @@ class Variable:
     ACROSS = "across"
     DOWN = "down"
 
+    # Fixed attribute layout: avoids a per-instance __dict__, shrinking each
+    # Variable and speeding up the attribute loads in the solver's hot loops
+    __slots__ = ("i", "j", "direction", "length", "_hash", "id")
+
     def __init__(self, i, j, direction, length):
         """
         Creates a new variable with starting point, direction, and length.
@@ -31,23 +35,43 @@ class Variable:
         self.j = j
         self.direction = direction
         self.length = length
-        self.cells = []
-        for k in range(self.length):
-            self.cells.append(
-                (
-                    self.i + (k if self.direction == Variable.DOWN else 0),
-                    self.j + (k if self.direction == Variable.ACROSS else 0),
-                )
-            )
+        self._hash = hash((i, j, direction, length))
+
+    def cell(self, k):
+        """
+        Returns the coordinate of the variable's kth cell, computed arithmetically.
+
+        Args:
+        k (int): The index of the cell along the variable (0-based).
+
+        Returns:
+        tuple of int: The (row, column) coordinate of the kth cell.
+        """
+        if self.direction == Variable.DOWN:
+            return (self.i + k, self.j)
+        return (self.i, self.j + k)
+
+    @property
+    def cells(self):
+        """
+        Returns the list of coordinates covered by the variable.
+
+        The cells are linear in (i, j, direction, length), so they are derived
+        on demand rather than materialized at construction time.
+
+        Returns:
+        list of tuple: The (row, column) coordinates of the variable's cells.
+        """
+        return [self.cell(k) for k in range(self.length)]
 
     def __hash__(self):
         """
-        Generates a hash value for a Variable instance. This is useful for using Variable instances as keys in dictionaries.
+        Returns the hash value computed once at construction time. This is useful for using Variable instances as keys in dictionaries.
 
         Returns:
         int: The hash value of the variable.
         """
-        return hash((self.i, self.j, self.direction, self.length))
+        return self._hash
 
     def __eq__(self, other):
         """
@@ -105,78 +129,123 @@ class Crossword:
             self.height = len(contents)
             self.width = max(len(line) for line in contents)
 
+            # Pack each row as a bytearray (1 = open cell) for compact,
+            # cache-friendly storage while keeping structure[i][j] indexing
             self.structure = []
             for i in range(self.height):
-                row = []
-                for j in range(self.width):
-                    if j >= len(contents[i]):
-                        row.append(False)
-                    elif contents[i][j] == "_":
-                        row.append(True)
-                    else:
-                        row.append(False)
+                row = bytearray(self.width)
+                line = contents[i]
+                for j in range(min(len(line), self.width)):
+                    if line[j] == "_":
+                        row[j] = 1
                 self.structure.append(row)
 
         # Save vocabulary list
         with open(words_file) as f:
             self.words = set(f.read().upper().splitlines())
 
-        # Determine variable set
+        # Determine variable set with one linear sweep per axis: each row is
+        # scanned once for horizontal runs and each column once for vertical
+        # runs, emitting a variable whenever a run of open cells ends
         self.variables = set()
         for i in range(self.height):
-            for j in range(self.width):
-                # Vertical words
-                starts_word = self.structure[i][j] and (
-                    i == 0 or not self.structure[i - 1][j]
-                )
-                if starts_word:
-                    length = 1
-                    for k in range(i + 1, self.height):
-                        if self.structure[k][j]:
-                            length += 1
-                        else:
-                            break
-                    if length > 1:
+            row = self.structure[i]
+            start = None
+            for j in range(self.width + 1):
+                if j < self.width and row[j]:
+                    if start is None:
+                        start = j
+                elif start is not None:
+                    if j - start > 1:
                         self.variables.add(
-                            Variable(i=i, j=j, direction=Variable.DOWN, length=length)
+                            Variable(
+                                i=i, j=start, direction=Variable.ACROSS, length=j - start
+                            )
                         )
+                    start = None
 
-                # Horizontal words
-                starts_word = self.structure[i][j] and (
-                    j == 0 or not self.structure[i][j - 1]
-                )
-                if starts_word:
-                    length = 1
-                    for k in range(j + 1, self.width):
-                        if self.structure[i][k]:
-                            length += 1
-                        else:
-                            break
-                    if length > 1:
+        for j in range(self.width):
+            start = None
+            for i in range(self.height + 1):
+                if i < self.height and self.structure[i][j]:
+                    if start is None:
+                        start = i
+                elif start is not None:
+                    if i - start > 1:
                         self.variables.add(
-                            Variable(i=i, j=j, direction=Variable.ACROSS, length=length)
+                            Variable(
+                                i=start, j=j, direction=Variable.DOWN, length=i - start
+                            )
                         )
+                    start = None
+
+        # Assign each variable a dense integer id so pairwise lookups can
+        # index a flat list instead of hashing a (Variable, Variable) tuple
+        self.variable_list = list(self.variables)
+        for idx, var in enumerate(self.variable_list):
+            var.id = idx
+        n = len(self.variable_list)
 
         # Compute overlaps for each word
         # For any pair of variables v1, v2, their overlap is either:
         #    None, if the two variables do not overlap; or
         #    (i, j), where v1's ith character overlaps v2's jth character
+        # The overlaps are stored both in the flat id-indexed 'overlap_list'
+        # used by the solver's hot paths (see 'overlap') and in the public
+        # 'overlaps' dict keyed by variable pairs
+        # Since variables are axis-aligned maximal runs, two variables in the
+        # same direction never share a cell, and an across/down pair overlaps
+        # exactly when the across row falls within the down run and the down
+        # column falls within the across run, so the overlap indices follow
+        # directly from the starting coordinates with no cell-set intersection
         self.overlaps = dict()
+        self.overlap_list = [None] * (n * n)
         for v1 in self.variables:
             for v2 in self.variables:
                 if v1 == v2:
                     continue
-                cells1 = v1.cells
-                cells2 = v2.cells
-                intersection = set(cells1).intersection(cells2)
-                if not intersection:
-                    self.overlaps[v1, v2] = None
-                else:
-                    intersection = intersection.pop()
-                    self.overlaps[v1, v2] = (
-                        cells1.index(intersection),
-                        cells2.index(intersection),
+                overlap = None
+                if v1.direction != v2.direction:
+                    across, down = (
+                        (v1, v2) if v1.direction == Variable.ACROSS else (v2, v1)
                     )
+                    if (
+                        down.i <= across.i < down.i + down.length
+                        and across.j <= down.j < across.j + across.length
+                    ):
+                        k_across = down.j - across.j
+                        k_down = across.i - down.i
+                        overlap = (
+                            (k_across, k_down)
+                            if v1.direction == Variable.ACROSS
+                            else (k_down, k_across)
+                        )
+                self.overlaps[v1, v2] = overlap
+                self.overlap_list[v1.id * n + v2.id] = overlap
+
+        # Precompute each variable's neighbors from the overlaps table so
+        # neighbors() is a constant-time lookup rather than a scan of all
+        # variables on every call
+        self._neighbors = {
+            v: frozenset(u for u in self.variables if u != v and self.overlaps[u, v])
+            for v in self.variables
+        }
+
+    def overlap(self, v1, v2):
+        """
+        Returns the overlap of two variables via their dense integer ids.
+
+        Equivalent to 'self.overlaps[v1, v2]' but indexes a flat list with
+        integer arithmetic instead of hashing a tuple of variables.
+
+        Args:
+        v1 (Variable): A variable in the crossword puzzle.
+        v2 (Variable): Another variable in the crossword puzzle.
+
+        Returns:
+        tuple of int or None: (i, j) if v1's ith character overlaps v2's jth character, otherwise None.
+        """
+        return self.overlap_list[v1.id * len(self.variable_list) + v2.id]
 
     def neighbors(self, var):
         """
@@ -186,6 +255,6 @@ class Crossword:
         var (Variable): A variable in the crossword puzzle.
 
         Returns:
-        set of Variable: A set of variables that overlap with 'var'.
+        frozenset of Variable: The set of variables that overlap with 'var'.
         """
-        return set(v for v in self.variables if v != var and self.overlaps[v, var])
+        return self._neighbors[var]
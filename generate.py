@@ -13,9 +13,17 @@ Where:
     'output' is an optional argument specifying the name of the file to save the crossword image.
 """
 import sys
+from collections import defaultdict, deque
 
 from crossword import *
 
+# NumPy is optional: when present, bulk word scans are vectorized; the solver
+# falls back to pure-Python loops without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class CrosswordCreator:
     """
@@ -31,10 +39,34 @@ class CrosswordCreator:
         crossword (Crossword): An instance of the Crossword class containing the structure of the crossword.
         """
         self.crossword = crossword
+
+        # Bucket the vocabulary by word length once so each variable starts
+        # from only the words that can fit it. Same-length variables share the
+        # bucket itself; '_remove_word' clones a private copy the first time a
+        # variable's domain is actually pruned (copy-on-write)
+        by_length = defaultdict(set)
+        for word in self.crossword.words:
+            by_length[len(word)].add(word)
         self.domains = {
-            var: self.crossword.words.copy() for var in self.crossword.variables
+            var: by_length[var.length] for var in self.crossword.variables
+        }
+        self._owned = set()
+
+        # Degree of each variable, precomputed for the MRV tie-breaker
+        self.degree = {
+            var: len(self.crossword.neighbors(var))
+            for var in self.crossword.variables
         }
 
+        # Words currently used by the assignment, mapped to the variable that
+        # holds them and maintained alongside backtrack's push/pop so
+        # uniqueness checks are O(1) and conflicts can name their culprit
+        self._used = dict()
+
+        # For each variable, the set of assigned variables whose assignments
+        # have pruned its live bitset; used to direct backjumping
+        self._conflicts = {var: set() for var in self.crossword.variables}
+
     def letter_grid(self, assignment):
         """
         Converts the crossword assignment into a 2D array of characters.
@@ -43,8 +75,24 @@ class CrosswordCreator:
         assignment (dict): A dictionary representing the current assignment of words to variables.
 
         Returns:
-        list of list of str: A 2D array representing the crossword grid filled with assigned words.
+        2D array of str: The crossword grid filled with assigned words; empty cells hold a falsy value. A NumPy 'U1' array when NumPy is available, otherwise a list of lists.
         """
+        if np is not None:
+            # One slice assignment per word instead of a Python loop per cell
+            letters = np.full(
+                (self.crossword.height, self.crossword.width), "", dtype="U1"
+            )
+            for variable, word in assignment.items():
+                if variable.direction == Variable.ACROSS:
+                    letters[
+                        variable.i, variable.j : variable.j + variable.length
+                    ] = list(word)
+                else:
+                    letters[
+                        variable.i : variable.i + variable.length, variable.j
+                    ] = list(word)
+            return letters
+
         letters = [
             [None for _ in range(self.crossword.width)]
             for _ in range(self.crossword.height)
@@ -95,30 +143,38 @@ class CrosswordCreator:
             "black",
         )
         font = ImageFont.truetype("assets/fonts/OpenSans-Regular.ttf", 80)
-        draw = ImageDraw.Draw(img)
+
+        # Render each distinct letter onto a white tile once and paste the
+        # cached tiles, instead of measuring and drawing text per cell
+        blank = Image.new("RGBA", (interior_size, interior_size), "white")
+        tiles = {}
 
         for i in range(self.crossword.height):
             for j in range(self.crossword.width):
-                rect = [
-                    (j * cell_size + cell_border, i * cell_size + cell_border),
-                    (
-                        (j + 1) * cell_size - cell_border,
-                        (i + 1) * cell_size - cell_border,
-                    ),
-                ]
-                if self.crossword.structure[i][j]:
-                    draw.rectangle(rect, fill="white")
-                    if letters[i][j]:
-                        _, _, w, h = draw.textbbox((0, 0), letters[i][j], font=font)
+                if not self.crossword.structure[i][j]:
+                    continue
+                letter = letters[i][j]
+                if letter:
+                    tile = tiles.get(letter)
+                    if tile is None:
+                        tile = blank.copy()
+                        draw = ImageDraw.Draw(tile)
+                        _, _, w, h = draw.textbbox((0, 0), letter, font=font)
                         draw.text(
                             (
-                                rect[0][0] + ((interior_size - w) / 2),
-                                rect[0][1] + ((interior_size - h) / 2) - 10,
+                                (interior_size - w) / 2,
+                                (interior_size - h) / 2 - 10,
                             ),
-                            letters[i][j],
+                            letter,
                             fill="black",
                             font=font,
                         )
+                        tiles[letter] = tile
+                else:
+                    tile = blank
+                img.paste(
+                    tile, (j * cell_size + cell_border, i * cell_size + cell_border)
+                )
 
         img.save(filename)
 
@@ -131,16 +187,103 @@ class CrosswordCreator:
         """
         self.enforce_node_consistency()
         self.ac3()
+        self._build_bitmasks()
         return self.backtrack(dict())
 
+    def _build_bitmasks(self):
+        """
+        Freezes the arc-consistent domains into per-variable bitmask indexes.
+
+        Each variable's surviving words are numbered, and for every (position,
+        letter) pair a Python int is built whose kth bit is set when word k has
+        that letter there. 'self.live[var]' is the bitset of words still
+        available during search; arbitrary-precision ints make intersection a
+        single bit-parallel '&' and domain size a popcount, and the
+        forward-checking trail shrinks to one saved int per pruned neighbor.
+        """
+        self.word_list = {}
+        self.bits = {}
+        self.live = {}
+        for var, words in self.domains.items():
+            word_list = sorted(words)
+            self.word_list[var] = word_list
+            bits = [defaultdict(int) for _ in range(var.length)]
+            for k, word in enumerate(word_list):
+                bit = 1 << k
+                for pos, ch in enumerate(word):
+                    bits[pos][ch] |= bit
+            self.bits[var] = bits
+            self.live[var] = (1 << len(word_list)) - 1
+
     def enforce_node_consistency(self):
         """
         Enforces node consistency by eliminating words that do not match the length of the variables.
+
+        The domains are already node-consistent by construction — they are
+        seeded from length buckets of the vocabulary — so this only builds the
+        letter index over them.
         """
-        for variable in self.domains:
-            for word in set(self.domains[variable]):
-                if len(word) != variable.length:
-                    self.domains[variable].remove(word)
+        self._build_letter_index()
+
+    def _build_letter_index(self):
+        """
+        Builds an index of each variable's domain keyed by (position, letter).
+
+        'self.letter_index[var][pos][ch]' is the set of words currently in
+        var's domain that have letter 'ch' at position 'pos'. The index lets
+        support tests and conflict counts replace a scan of a whole domain with
+        a single dictionary lookup, and is kept in sync with every domain
+        mutation by '_remove_word'.
+        """
+        self.letter_index = {
+            var: [defaultdict(set) for _ in range(var.length)]
+            for var in self.domains
+        }
+        for var, words in self.domains.items():
+            index = self.letter_index[var]
+            if np is not None and words:
+                # Vectorized build: pack the domain into an (n_words, length)
+                # code-point matrix and group word indices per column by
+                # letter, so the per-character inner loop runs in NumPy rather
+                # than the interpreter. utf-32-le is a lossless fixed-width
+                # encoding, so any character a word list may contain
+                # round-trips through chr()
+                word_list = list(words)
+                matrix = np.frombuffer(
+                    "".join(word_list).encode("utf-32-le"), dtype=np.uint32
+                ).reshape(len(word_list), var.length)
+                for pos in range(var.length):
+                    column = matrix[:, pos]
+                    order = np.argsort(column, kind="stable")
+                    letters, starts = np.unique(column[order], return_index=True)
+                    bounds = starts.tolist()[1:] + [len(word_list)]
+                    for code, start, stop in zip(letters.tolist(), starts, bounds):
+                        index[pos][chr(code)] = {
+                            word_list[k] for k in order[start:stop].tolist()
+                        }
+            else:
+                for word in words:
+                    for pos, ch in enumerate(word):
+                        index[pos][ch].add(word)
+
+    def _remove_word(self, var, word):
+        """
+        Removes a word from a variable's domain, keeping the letter index in sync.
+
+        The variable's domain may still be the length bucket shared with other
+        variables; the first removal clones it into a private set.
+
+        Args:
+        var (Variable): The variable whose domain the word is removed from.
+        word (str): The word to remove.
+        """
+        if var not in self._owned:
+            self.domains[var] = set(self.domains[var])
+            self._owned.add(var)
+        self.domains[var].remove(word)
+        index = self.letter_index[var]
+        for pos, ch in enumerate(word):
+            index[pos][ch].discard(word)
 
     def revise(self, x, y):
         """
@@ -154,17 +297,16 @@ class CrosswordCreator:
         bool: True if the domain of x is revised, False otherwise.
         """
         revised = False
-        overlap = self.crossword.overlaps[x, y]
+        overlap = self.crossword.overlap(x, y)
 
         if overlap is None:
             return revised
 
         x_index, y_index = overlap
+        y_buckets = self.letter_index[y][y_index]
         for x_word in set(self.domains[x]):
-            if not any(
-                x_word[x_index] == y_word[y_index] for y_word in self.domains[y]
-            ):
-                self.domains[x].remove(x_word)
+            if not y_buckets.get(x_word[x_index]):
+                self._remove_word(x, x_word)
                 revised = True
 
         return revised
@@ -173,22 +315,73 @@ class CrosswordCreator:
         """
         Enforces arc consistency on the puzzle's variables.
 
+        When no arc list is given, full consistency is established with the AC-4
+        algorithm: for every arc (x, y) and every word in x's domain, a counter of
+        supporting words in y's domain is precomputed, along with a reverse map
+        from each word to the (variable, word) pairs it supports. Deleting a word
+        then only decrements counters, and a word is removed exactly when its
+        support counter reaches zero, instead of rescanning whole domains per arc.
+
         Args:
         arcs (list of tuple): A list of arcs (pairs of variables) to be considered for consistency. If None, all arcs are considered.
 
         Returns:
         bool: True if arc consistency is achieved, False if an inconsistency is found.
         """
-        if arcs is None:
-            arcs = [(x, y) for x in self.domains for y in self.crossword.neighbors(x)]
-
-        while arcs:
-            x, y = arcs.pop(0)
-            if self.revise(x, y):
-                if not self.domains[x]:
-                    return False
-                for neighbor in self.crossword.neighbors(x) - {y}:
-                    arcs.append((neighbor, x))
+        if arcs is not None:
+            # A deque gives O(1) pops from the front of the worklist, and the
+            # companion set avoids enqueueing an arc that is already pending
+            worklist = deque(arcs)
+            pending = set(worklist)
+            while worklist:
+                arc = worklist.popleft()
+                pending.discard(arc)
+                x, y = arc
+                if self.revise(x, y):
+                    if not self.domains[x]:
+                        return False
+                    for neighbor in self.crossword.neighbors(x) - {y}:
+                        if (neighbor, x) not in pending:
+                            worklist.append((neighbor, x))
+                            pending.add((neighbor, x))
+            return True
+
+        # AC-4 initialization: count, for every arc (x, y) and every word in
+        # x's domain, how many words in y's domain support it. Words with no
+        # support are removed immediately and queued for propagation.
+        counter = dict()
+        supported = defaultdict(list)
+        queue = []
+        for x in self.domains:
+            for y in self.crossword.neighbors(x):
+                x_index, y_index = self.crossword.overlap(x, y)
+
+                # The letter index already buckets y's domain by the letter at
+                # the overlapping position, so each x_word needs only a single
+                # dictionary lookup
+                buckets = self.letter_index[y][y_index]
+                for x_word in set(self.domains[x]):
+                    support = buckets.get(x_word[x_index], ())
+                    counter[x, y, x_word] = len(support)
+                    for y_word in support:
+                        supported[y, y_word].append((x, x_word))
+                    if not support:
+                        self._remove_word(x, x_word)
+                        queue.append((x, x_word))
+
+        # Propagation: each deletion decrements the counters of the words it
+        # supported; any counter hitting zero triggers another deletion
+        while queue:
+            y, y_word = queue.pop()
+            if not self.domains[y]:
+                return False
+            for x, x_word in supported.pop((y, y_word), ()):
+                if x_word not in self.domains[x]:
+                    continue
+                counter[x, y, x_word] -= 1
+                if counter[x, y, x_word] == 0:
+                    self._remove_word(x, x_word)
+                    queue.append((x, x_word))
 
         return True
 
@@ -223,7 +416,7 @@ class CrosswordCreator:
 
             for neighbor in self.crossword.neighbors(variable):
                 if neighbor in assignment:
-                    overlap = self.crossword.overlaps[variable, neighbor]
+                    overlap = self.crossword.overlap(variable, neighbor)
                     if value[overlap[0]] != assignment[neighbor][overlap[1]]:
                         return False
 
@@ -241,19 +434,36 @@ class CrosswordCreator:
         list: An ordered list of domain values for the variable.
         """
 
+        live = self.live[var]
+        values = [
+            word for k, word in enumerate(self.word_list[var]) if (live >> k) & 1
+        ]
+
+        # Candidate values sharing a letter at an overlap position eliminate
+        # exactly the same neighbor words there, so conflicts are tallied once
+        # per (position, letter) pair rather than once per candidate value
+        overlap = self.crossword.overlap
+        live_sets = self.live
+        bits = self.bits
+        conflicts = defaultdict(dict)
+        for neighbor in self.crossword.neighbors(var):
+            if neighbor in assignment:
+                continue
+            v_index, n_index = overlap(var, neighbor)
+            n_live = live_sets[neighbor]
+            total = n_live.bit_count()
+            buckets = bits[neighbor][n_index]
+            per_letter = conflicts[v_index]
+            for ch in {value[v_index] for value in values}:
+                supported = n_live & buckets.get(ch, 0)
+                per_letter[ch] = per_letter.get(ch, 0) + total - supported.bit_count()
+
         def count_conflicts(value):
-            count = 0
-            for neighbor in self.crossword.neighbors(var):
-                if neighbor not in assignment:
-                    overlap = self.crossword.overlaps[var, neighbor]
-                    count += sum(
-                        1
-                        for word in self.domains[neighbor]
-                        if word[overlap[1]] != value[overlap[0]]
-                    )
-            return count
-
-        return sorted(self.domains[var], key=count_conflicts)
+            return sum(
+                per_letter[value[pos]] for pos, per_letter in conflicts.items()
+            )
+
+        return sorted(values, key=count_conflicts)
 
     def select_unassigned_variable(self, assignment):
         """
@@ -266,35 +476,188 @@ class CrosswordCreator:
         Variable: The selected unassigned variable.
         """
 
+        live_sets = self.live
+        degree = self.degree
+
         def mrv(variable):
-            return len(self.domains[variable]), -len(self.crossword.neighbors(variable))
+            return live_sets[variable].bit_count(), -degree[variable]
+
+        return min(
+            (v for v in self.crossword.variables if v not in assignment), key=mrv
+        )
+
+    def _forward_check(self, var, value, assignment):
+        """
+        Prunes the live bitsets of var's unassigned neighbors after assigning a value.
 
-        unassigned = [v for v in self.crossword.variables if v not in assignment]
-        return min(unassigned, key=mrv)
+        Each neighbor's live bitset is intersected with the precomputed mask of
+        words compatible with 'value' at the overlapping cell — one bit-parallel
+        '&' per neighbor. The previous bitsets are recorded on a trail so they
+        can be restored when the search backtracks.
+
+        Args:
+        var (Variable): The variable that was just assigned.
+        value (str): The word assigned to 'var'.
+        assignment (dict): The current assignment.
+
+        Each pruned neighbor also records 'var' in its conflict set so a later
+        failure can identify which assignments starved its domain. Pruning
+        does not stop at the direct neighbors: arc consistency is maintained
+        (MAC) by re-propagating every shrunken bitset to its own unassigned
+        neighbors until a fixpoint, which prunes deeper than plain forward
+        checking at the cost of a few mask operations per affected arc.
+
+        Returns:
+        tuple: (trail, None) on success, where the trail of (variable,
+        previous_bitset, previous_conflicts) entries undoes the pruning; or
+        (None, conflict_set) if some variable's domain was wiped out, where
+        the conflict set names the previously assigned culprits (all pruning
+        already undone).
+        """
+        # Hoist instance lookups out of the loop; this runs once per value
+        # tried at every search node
+        overlap = self.crossword.overlap
+        neighbors = self.crossword.neighbors
+        live_sets = self.live
+        bits = self.bits
+        conflicts = self._conflicts
+
+        trail = []
+        pruned = deque()
+        for neighbor in neighbors(var):
+            if neighbor in assignment:
+                continue
+            v_index, n_index = overlap(var, neighbor)
+            live = live_sets[neighbor]
+            surviving = live & bits[neighbor][n_index].get(value[v_index], 0)
+            if not surviving:
+                conflict = set(conflicts[neighbor])
+                self._undo_trail(trail)
+                return None, conflict
+            if surviving != live:
+                trail.append((neighbor, live, conflicts[neighbor]))
+                conflicts[neighbor] = conflicts[neighbor] | {var}
+                live_sets[neighbor] = surviving
+                pruned.append(neighbor)
+
+        # MAC: each shrunken variable may in turn have starved the support of
+        # words in its own neighbors, so re-revise those arcs until nothing
+        # changes. A word in m survives the arc (m, n) iff some live word in n
+        # still carries the matching letter, so each letter of m whose support
+        # mask misses n's live set is stripped with one bit-parallel '&'
+        while pruned:
+            n = pruned.popleft()
+            n_live = live_sets[n]
+            for m in neighbors(n):
+                if m == var or m in assignment:
+                    continue
+                m_index, n_index = overlap(m, n)
+                m_live = live_sets[m]
+                n_bits = bits[n][n_index]
+                surviving = m_live
+                for ch, mask in bits[m][m_index].items():
+                    if mask & surviving and not n_bits.get(ch, 0) & n_live:
+                        surviving &= ~mask
+                if surviving == m_live:
+                    continue
+                culprit = conflicts[n] | {var}
+                if not surviving:
+                    conflict = conflicts[m] | culprit
+                    conflict.discard(var)
+                    self._undo_trail(trail)
+                    return None, conflict
+                trail.append((m, m_live, conflicts[m]))
+                conflicts[m] = conflicts[m] | culprit
+                live_sets[m] = surviving
+                pruned.append(m)
+        return trail, None
+
+    def _undo_trail(self, trail):
+        """
+        Restores live bitsets and conflict sets pruned by forward checking.
+
+        Args:
+        trail (list of tuple): (variable, previous_bitset, previous_conflicts) entries recorded by '_forward_check'.
+        """
+        for var, live, conflicts in reversed(trail):
+            self.live[var] = live
+            self._conflicts[var] = conflicts
 
     def backtrack(self, assignment):
         """
         Backtrack search for solving the crossword puzzle.
 
+        The search is conflict-directed: every failure carries the set of
+        assigned variables that caused it, and when that set does not involve
+        the variable currently being tried, the search jumps straight past it
+        instead of chronologically retrying unrelated values.
+
         Args:
         assignment (dict): The current assignment.
 
         Returns:
         dict or None: The complete assignment if a solution is found, or None if there is no solution.
         """
+        result, _ = self._backjump(assignment)
+        return result
+
+    def _backjump(self, assignment):
+        """
+        Recursive forward-checking search with conflict-directed backjumping.
+
+        Each tried value is forward checked (failing fast on a wipeout), and
+        the assignment dict, used-word map, and pruning trail are unwound in
+        place rather than copied at every node. Failures return the set of
+        assigned variables implicated: wiped-out neighbors contribute the
+        variables that pruned them, duplicate words contribute the variable
+        holding the word, and a subtree whose conflict set does not mention
+        this node's variable aborts the remaining values here so the search
+        backjumps to the deepest variable actually responsible.
+
+        Args:
+        assignment (dict): The current assignment.
+
+        Returns:
+        tuple: (assignment, empty set) if a solution is found, or (None,
+        conflict_set) naming the assigned variables responsible for the
+        failure.
+        """
         if self.assignment_complete(assignment):
-            return assignment
+            return assignment, set()
 
         var = self.select_unassigned_variable(assignment)
+        conflict = set()
         for value in self.order_domain_values(var, assignment):
-            new_assignment = assignment.copy()
-            new_assignment[var] = value
-            if self.consistent(new_assignment):
-                result = self.backtrack(new_assignment)
-                if result is not None:
-                    return result
-
-        return None
+            owner = self._used.get(value)
+            if owner is not None:
+                conflict.add(owner)
+                continue
+            trail, wipeout = self._forward_check(var, value, assignment)
+            if trail is None:
+                conflict |= wipeout
+                continue
+            assignment[var] = value
+            self._used[value] = var
+            result, child_conflict = self._backjump(assignment)
+            if result is not None:
+                return result, set()
+            del assignment[var]
+            del self._used[value]
+            self._undo_trail(trail)
+            if var not in child_conflict:
+                # The failure below does not involve this variable's choice,
+                # so retrying other values here cannot help: jump past it
+                return None, child_conflict
+            child_conflict.discard(var)
+            conflict |= child_conflict
+
+        # The values offered above are only the words still live for this
+        # variable; ancestors whose forward checks pruned the others are just
+        # as responsible for the exhaustion, so their culprit set must join
+        # the conflict or the jump could skip past them and miss solutions
+        conflict |= self._conflicts[var]
+        conflict.discard(var)
+        return None, conflict
 
 
 def main():
@@ -0,0 +1,52 @@
+"""
+Regression tests for the crossword solver.
+
+Usage:
+    python -m unittest test_generate
+"""
+import os
+import tempfile
+import unittest
+
+from crossword import Crossword
+from generate import CrosswordCreator
+
+
+class BackjumpRegressionTest(unittest.TestCase):
+    """
+    Regression test for conflict-directed backjumping.
+
+    This instance made the solver report no solution when the conflict set of
+    an exhausted variable omitted the ancestors whose forward checks had
+    pruned its domain, causing the backjump to skip past the real culprit.
+    """
+
+    STRUCTURE = "____x_\nx_xx_x\n____x_\nxx____\n____xx\n"
+    WORDS = [
+        "CBBA", "AACA", "AAACAA", "ACC", "AAB", "CCCBAA", "BB", "AABB",
+        "BBB", "CB", "CAC", "BAA", "BBBBA", "BAAAA", "CBA", "ABA", "ACCB",
+        "BCBCCC",
+    ]
+
+    def test_solvable_puzzle_is_solved(self):
+        """
+        The solver finds a complete, consistent assignment for a puzzle known
+        to be solvable.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            structure_file = os.path.join(tmp, "structure.txt")
+            words_file = os.path.join(tmp, "words.txt")
+            with open(structure_file, "w") as f:
+                f.write(self.STRUCTURE)
+            with open(words_file, "w") as f:
+                f.write("\n".join(self.WORDS))
+            creator = CrosswordCreator(Crossword(structure_file, words_file))
+
+        assignment = creator.solve()
+        self.assertIsNotNone(assignment)
+        self.assertTrue(creator.assignment_complete(assignment))
+        self.assertTrue(creator.consistent(assignment))
+
+
+if __name__ == "__main__":
+    unittest.main()